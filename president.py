@@ -3,12 +3,16 @@
 import re
 import sys
 from argparse import ArgumentParser
-from random import choice
+from contextlib import redirect_stdout
+from copy import copy
+from io import StringIO
+from random import Random
 
 
 SUITS = ["Hearts", "Diamonds", "Spades", "Clubs"]
 ROLES = ["President", "Vice President", "Neutral 1", "Neutral 2", "Neutral 3", "Vice Trash", "Trash"]
 CARD_VALUES = ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]
+CHECKPOINT_INTERVAL = 25
 
 
 class Card:
@@ -402,8 +406,16 @@ class Game:
         - roles_left (list): a list of all the available roles which can be won during the game
         - current_player (Player): the person who is currently playing
         - last_played (list or None): the last card(s) which were played
+        - seed (int or None): the seed used to shuffle the deck
+        - rng (Random): the random number generator used to shuffle the deck
+        - roster (list): every player in the session, in their original order
+        - turn (int): the turn counter of the current game
+        - skip_count (int): how many players have skipped in a row
+        - history (list): every move made during the session as (player name, response) tuples
+        - checkpoints (dict): snapshots of the game keyed by the number of moves made
+        - checkpoint_interval (int): how many moves are made between checkpoints
     """
-    def __init__(self, players):
+    def __init__(self, players, seed=None, checkpoint_interval=CHECKPOINT_INTERVAL):
         """
         Primary Author: smallfrycode
         Techniques Demonstrated: N/A
@@ -412,9 +424,12 @@ class Game:
         
         Args:
             players (list): a list of all player objects.
+            seed (int or None): the seed used to shuffle the deck, None for a random seed.
+            checkpoint_interval (int): how many moves are made between checkpoints.
             
         Side effects:
-            Creates attributes: deck, players, roles_left, out, current_player, last_played.
+            Creates attributes: deck, players, roles_left, out, current_player, last_played,
+            seed, rng, roster, turn, skip_count, history, checkpoints, checkpoint_interval.
         """
         self.deck = []
         self.players = players
@@ -422,6 +437,14 @@ class Game:
         self.out = []
         self.current_player = None
         self.last_played = None    
+        self.seed = seed
+        self.rng = Random(seed)
+        self.roster = list(players)
+        self.turn = 0
+        self.skip_count = 0
+        self.history = []
+        self.checkpoints = {}
+        self.checkpoint_interval = checkpoint_interval
         
     def shuffle(self):
         """
@@ -441,7 +464,7 @@ class Game:
         
         # shuffle the deck
         while unshuffled_deck:
-            chosen_card = choice(unshuffled_deck)
+            chosen_card = self.rng.choice(unshuffled_deck)
             self.deck.append(chosen_card)
             unshuffled_deck.remove(chosen_card)
         
@@ -512,6 +535,156 @@ class Game:
         """
         return GameState(self.players, self.last_played, self.current_player, self.out)
     
+    def checkpoint(self):
+        """
+        Primary Author: smallfrycode
+        Techniques Demonstrated: List comprehensions
+        
+        Saves a snapshot of the game which can later be restored by replay().
+        
+        Side effects:
+            Changes checkpoints attribute of Game.
+        """
+        self.checkpoints[len(self.history)] = {
+            "players": [self.roster.index(player) for player in self.players],
+            "out": [self.roster.index(player) for player in self.out],
+            "hands": [list(player.hand) for player in self.roster],
+            "roles": [player.role for player in self.roster],
+            "roles_left": list(self.roles_left),
+            "last_played": None if self.last_played is None else list(self.last_played),
+            "turn": self.turn,
+            "skip_count": self.skip_count
+        }
+        
+    def restore(self, snapshot):
+        """
+        Primary Author: smallfrycode
+        Techniques Demonstrated: List comprehensions
+        
+        Restores the game to a snapshot made by checkpoint().
+        
+        Args:
+            snapshot (dict): a snapshot from the checkpoints attribute of a Game with the same roster.
+            
+        Side effects:
+            - Changes attributes of the Game Class
+            - Changes hand and role attributes of players
+        """
+        for player, hand, role in zip(self.roster, snapshot["hands"], snapshot["roles"]):
+            player.hand = list(hand)
+            player.role = role
+        self.players = [self.roster[index] for index in snapshot["players"]]
+        self.out = [self.roster[index] for index in snapshot["out"]]
+        self.roles_left = list(snapshot["roles_left"])
+        last_played = snapshot["last_played"]
+        self.last_played = None if last_played is None else list(last_played)
+        self.turn = snapshot["turn"]
+        self.skip_count = snapshot["skip_count"]
+        
+    def replay(self, move):
+        """
+        Primary Author: smallfrycode
+        Techniques Demonstrated: Composition of two custom classes
+        
+        Rebuilds the state of the game after a number of moves were made during the session. The
+        nearest checkpoint is restored on a copy of the game and only the remaining moves are re-applied,
+        so the game itself is left untouched.
+        
+        Args:
+            move (int): the number of moves made (passes and plays, counted across every round).
+            
+        Raises:
+            ValueError: If no game has been recorded or move is out of range.
+            
+        Returns:
+            a GameState object.
+        """
+        if not self.checkpoints:
+            raise ValueError("No recorded game to replay")
+        if not 0 <= move <= len(self.history):
+            raise ValueError("Invalid move input")
+        
+        start = max(index for index in self.checkpoints if index <= move)
+        game = Game([copy(player) for player in self.roster], self.seed, self.checkpoint_interval)
+        game.restore(self.checkpoints[start])
+        game.history = self.history[:start]
+        
+        # re-apply the recorded moves without printing them again
+        with redirect_stdout(StringIO()):
+            game.advance(lambda player: self.history[len(game.history)][1], until=move)
+        return game.state()
+    
+    def advance(self, respond, until=None):
+        """
+        Primary Author: smallfrycode
+        Techniques Demonstrated: N/A
+        
+        Progresses through the game until one player is left or until a number of moves were made.
+        
+        Args:
+            respond (function): called with the current player, returns their response (list of Cards or None).
+            until (int or None): stop once this many moves were made, None to finish the game.
+            
+        Side effects:
+            - Changes attributes of the Game Class and Player Class
+            - Prints the progress of the game
+        """
+        while len(self.players) > 1:
+            player = self.players[self.turn % len(self.players)]
+            self.current_player = player
+            # check to make sure someone can play, if no one can reset
+            if self.skip_count >= (len(self.players) - 1):
+                self.skip_count = 0
+                self.last_played = None
+                self.turn += len(self.players)
+                continue
+            
+            # stop early when replaying, otherwise save a checkpoint every checkpoint_interval moves
+            if until is not None and len(self.history) >= until:
+                return
+            if self.history and len(self.history) % self.checkpoint_interval == 0 \
+                    and len(self.history) not in self.checkpoints:
+                self.checkpoint()
+            
+            # response must be a list of card objects
+            response = respond(player)
+            if response is None:
+                self.skip_count += 1
+                print(f"{player.name} has skipped their turn.")
+            elif response[0].rank == CARD_VALUES[-1]:
+                self.skip_count = 0
+                self.last_played = None
+                for card in response:
+                    player.hand.remove(card)
+                if player.hand: # player goes again if they don't have an empty hand
+                    self.history.append((player.name, response))
+                    continue
+            elif response[0].validate(last_played=self.last_played, play=response):
+                self.last_played = response
+                for card in response:
+                    player.hand.remove(card)
+                self.skip_count = 0
+            else:
+                print(f"Sorry {player.name}, that is not a valid play.")
+                continue
+            self.history.append((player.name, response))
+            
+            # add player to out list and give them proper role
+            if not player.hand:
+                if response and self.last_card_bomb(response):
+                    player.role = self.roles_left.pop()
+                else:
+                    player.role = self.roles_left.pop(0)
+                self.out.append(player)
+                self.players.remove(player)
+                print(f"{player.name} has emptied their hand and became {player.role}")
+            # stop the game when one player is left
+            if len(self.players) <= 1:
+                break
+            
+            # iterate through list of players
+            self.turn += 1
+    
     def play(self, first_game):
         """
         Primary Author: smallfrycode
@@ -540,67 +713,17 @@ class Game:
         self.create_roles()
             
         # begin actual game
-        skip_count = 0
-        turn = 0
-        while len(self.players) > 1:
-            # start the game
-            player = self.players[turn % len(self.players)]
-            self.current_player = player
-            # continue until valid response
-            valid_response = False
-            response = None
-            while not valid_response:
-                # check to make sure someone can play, if no one can reset
-                if skip_count >= (len(self.players) - 1):
-                    skip_count = 0
-                    self.last_played = None
-                    turn += (len(self.players) - 1)
-                    break
-                
-                # response must be a list of card objects
-                response = player.turn(self.state())
-                if response is None:
-                    valid_response = True
-                    skip_count += 1
-                    print(f"{player.name} has skipped their turn.")
-                elif response[0].rank == CARD_VALUES[-1]:
-                    skip_count = 0
-                    self.last_played = None
-                    for card in response:
-                        player.hand.remove(card)
-                    if player.hand: # player goes again if they don't have an empty hand
-                        continue
-                    valid_response = True
-                elif response[0].validate(last_played=self.last_played, play=response):
-                    self.last_played = response
-                    for card in response:
-                        player.hand.remove(card)
-                    skip_count = 0
-                    valid_response = True
-                else:
-                    print(f"Sorry {player.name}, that is not a valid play.")
-            # add player to out list and give them proper role
-            if not player.hand:
-                if response and self.last_card_bomb(response):
-                    player.role = self.roles_left.pop()
-                else:
-                    player.role = self.roles_left.pop(0)
-                self.out.append(player)
-                self.players.remove(player)
-                print(f"{player.name} has emptied their hand and became {player.role}")
-            # stop the game when one player is left
-            if len(self.players) <= 1:
-                break
-            
-            # iterate through list of players
-            turn += 1
+        self.skip_count = 0
+        self.turn = 0
+        self.checkpoint()
+        self.advance(lambda player: player.turn(self.state()))
         
         last_player = self.players.pop()
         last_player.role = self.roles_left.pop()
         self.out.append(last_player)
         print(f"\nPresident has concluded, here are the results:\n{self.state().results()}")
 
-def main(players, computers):
+def main(players, computers, seed=None):
     """
     Primary Author: andychen47
     Techniques Demonstrated: N/A
@@ -610,9 +733,13 @@ def main(players, computers):
     Args:
         players (list): list of human player names.
         computers (int): number of computer players.
+        seed (int or None): the seed used to shuffle the deck, None for a random seed.
         
     Side effects:
         Creates Player objects, a Game object, and prompts user for input.
+        
+    Returns:
+        the Game object, which can be replayed to any move with Game.replay().
     """
     
     max_players = len(ROLES)
@@ -640,7 +767,7 @@ def main(players, computers):
         total_players.append(ComputerPlayer(name=f"Computer {i + 1}", hand=[]))
 
     # Initialize the game instance
-    game = Game(total_players)
+    game = Game(total_players, seed)
     
     # Start the game
     first_game = True
@@ -650,6 +777,7 @@ def main(players, computers):
         play_again = input("Play another round? (yes/no): ").strip().lower()
         if play_again != 'yes':
             break
+    return game
         
 def parse_args(arglist):
     """
@@ -662,13 +790,14 @@ def parse_args(arglist):
         arglist (list): arguments from the terminal.
     
     Returns:
-        a namespace of human players and amount of computers.
+        a namespace of human players, amount of computers, and the seed.
     """
     parser = ArgumentParser(description="President card game.")
     parser.add_argument('players', nargs='+', help='List of human player names')
     parser.add_argument('-c', '--computers', type=int, help='Number of computer players', default=0)
+    parser.add_argument('-s', '--seed', type=int, help='Seed used to shuffle the deck', default=None)
     return parser.parse_args(arglist)
 
 if __name__ == "__main__":
     args = parse_args(sys.argv[1:])
-    main(args.players, args.computers)
\ No newline at end of file
+    main(args.players, args.computers, args.seed)
\ No newline at end of file